@@ -4,15 +4,21 @@
 import os
 import shutil
 import sys
+from functools import lru_cache
 from typing import Any
 
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service
 
 
+# BASE_URL / API_BASE_URL may contain a "{worker}" placeholder so that each
+# parallel worker (behavex -D worker_id=N, or BEHAVE_WORKER_ID) targets its
+# own service and database
 BASE_URL = os.getenv("BASE_URL", "http://localhost:8000").rstrip("/")
 API_BASE_URL = os.getenv("API_BASE_URL", f"{BASE_URL}/api").rstrip("/")
 RESET_TIMEOUT = int(os.getenv("RESET_TIMEOUT", "15"))
@@ -28,6 +34,19 @@ SEED_ITEMS = [
     }
 ]
 
+# One keep-alive session shared by every scenario reset
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
 
 def _exists(p: str | None) -> bool:
     return bool(p and os.path.exists(p))
@@ -41,6 +60,7 @@ def _which(*names: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def _find_chrome_binary() -> str | None:
     # Explicit override via env
     env_path = os.getenv("CHROME_BIN")
@@ -63,6 +83,7 @@ def _find_chrome_binary() -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def _find_chromedriver() -> str | None:
     # Explicit override via env
     env_path = os.getenv("CHROMEDRIVER")
@@ -81,46 +102,65 @@ def _find_chromedriver() -> str | None:
     return None
 
 
-def _api_url(path: str) -> str:
-    """Build an absolute API URL from a relative path."""
-    trimmed = path.strip("/")
-    return f"{API_BASE_URL}/{trimmed}"
+def _worker_id(context) -> str:
+    """Return the parallel worker id for this behave process ('' when serial)."""
+    return str(
+        context.config.userdata.get("worker_id", os.getenv("BEHAVE_WORKER_ID", ""))
+    )
+
+
+def _worker_seed_items(worker: str) -> list[dict[str, Any]]:
+    """Suffix seed SKUs with the worker id so parallel workers never collide."""
+    if not worker:
+        return SEED_ITEMS
+    return [{**seed, "sku": f"{seed['sku']}-w{worker}"} for seed in SEED_ITEMS]
+
 
+def _seed_fingerprint(items: list[Any], seed_items: list[dict[str, Any]]) -> set[tuple]:
+    """Reduce inventory items to the seeded fields so they can be compared."""
+    keys = sorted(seed_items[0]) if seed_items else []
+    return {tuple(item.get(key) for key in keys) for item in items}
 
-def _reset_inventory_state() -> None:
+
+def _reset_inventory_state(inv_url: str, seed_items: list[dict[str, Any]]) -> None:
     """Ensure each scenario begins with a clean, known dataset."""
-    session = requests.Session()
+    session = _SESSION
     try:
-        resp = session.get(_api_url("inventory"), timeout=RESET_TIMEOUT)
+        resp = session.get(inv_url, timeout=RESET_TIMEOUT)
         resp.raise_for_status()
         payload: list[Any] = resp.json() or []
     except RequestException as err:
         raise RuntimeError(f"Unable to list inventory: {err}") from err
 
-    for item in payload:
-        inv_id = item.get("id")
-        if inv_id is None:
-            continue
-        try:
-            session.delete(
-                _api_url(f"inventory/{inv_id}"), timeout=RESET_TIMEOUT
-            ).raise_for_status()
-        except RequestException as err:
-            raise RuntimeError(f"Unable to delete inventory {inv_id}: {err}") from err
-
-    for seed in SEED_ITEMS:
-        try:
-            session.post(
-                _api_url("inventory"),
-                json=seed,
-                timeout=RESET_TIMEOUT,
-            ).raise_for_status()
-        except RequestException as err:
-            raise RuntimeError(f"Unable to seed inventory data: {err}") from err
+    # Nothing to do when the previous scenario left the seed data untouched
+    if len(payload) == len(seed_items) and _seed_fingerprint(
+        payload, seed_items
+    ) == _seed_fingerprint(seed_items, seed_items):
+        return
+
+    try:
+        session.delete(inv_url, timeout=RESET_TIMEOUT).raise_for_status()
+    except RequestException as err:
+        # a 403 means the service runs without INVENTORY_RESET_ENABLED
+        raise RuntimeError(f"Unable to delete inventory: {err}") from err
+
+    try:
+        session.post(
+            f"{inv_url}/bulk",
+            json={"items": seed_items},
+            timeout=RESET_TIMEOUT,
+        ).raise_for_status()
+    except RequestException as err:
+        raise RuntimeError(f"Unable to seed inventory data: {err}") from err
 
 
 def before_all(context):
     """Initialize a headless Chromium WebDriver with best-effort driver discovery."""
+    worker = _worker_id(context)
+    context.base_url = BASE_URL.format(worker=worker)
+    context.inventory_url = API_BASE_URL.format(worker=worker) + "/inventory"
+    context.seed_items = _worker_seed_items(worker)
+
     headless = os.getenv("HEADLESS", "true").lower() == "true"
 
     opts = ChromeOptions()
@@ -131,6 +171,13 @@ def before_all(context):
     opts.add_argument("--disable-dev-shm-usage")
     opts.add_argument("--disable-gpu")
     opts.add_argument("--window-size=1280,900")
+    # Skip work the UI tests never look at
+    opts.page_load_strategy = "eager"
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
 
     # Point to Chromium binary if Chrome is not installed
     chrome_bin = _find_chrome_binary()
@@ -148,13 +195,21 @@ def before_all(context):
         context.browser = webdriver.Chrome(options=opts)
 
 
+def _clear_browser_state(browser) -> None:
+    """Drop cookies and cached responses without restarting the browser."""
+    browser.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    browser.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+
 def before_scenario(context, scenario):  # pylint: disable=unused-argument
     """Reset API data so every scenario starts from a known baseline."""
     try:
-        _reset_inventory_state()
+        _reset_inventory_state(context.inventory_url, context.seed_items)
     except RuntimeError as err:
         print(f"[behave] Failed to reset inventory via API: {err}", file=sys.stderr)
         raise
+    # Reuse the browser from before_all; only its state is cleared
+    _clear_browser_state(context.browser)
 
 
 def after_all(context):
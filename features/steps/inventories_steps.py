@@ -1,6 +1,7 @@
 # features/steps/inventories_steps.py
 
 import os
+import re
 import uuid
 from typing import Any
 from behave import given, when, then
@@ -14,11 +15,52 @@ WAIT_SECONDS = int(os.getenv("WAIT_SECONDS", "15"))
 FLASH_MESSAGE_ID = "flash_message"
 SEARCH_RESULTS_ID = "search_results"
 CLIPBOARD_ATTR = "_clipboard_value"
+# First occurrence of `"id": <number>` in a JSON result block
+ID_RE = re.compile(r'"id"\s*:\s*(\d+)')
+# Wait predicates evaluated in the browser: one driver call per poll
+POLL_SECONDS = 0.1
+RESULT_READY_JS = (
+    "const r = document.getElementById('result');"
+    "return !!r && r.textContent.trim().startsWith('Status ');"
+)
+TEXT_PRESENT_JS = (
+    "const el = document.getElementById(arguments[0]);"
+    "return !!el && el.textContent.includes(arguments[1]);"
+)
+FORM_FIELD_IDS = ["name", "sku", "quantity", "category", "description", "price", "restock_level"]
+FILL_FORM_JS = (
+    "const d = arguments[0];"
+    "const values = {};"
+    "for (const k of arguments[1]) {"
+    "  const el = document.getElementById(k);"
+    "  if (!el) { throw new Error('Element not found: ' + k); }"
+    "  el.value = d[k];"
+    "  el.dispatchEvent(new Event('input', {bubbles:true}));"
+    "  values[k] = el.value;"
+    "}"
+    "const a = document.getElementById('available');"
+    "if (!!a && a.checked !== d.available) { a.click(); }"
+    "values.available = !!a && a.checked;"
+    "return values;"
+)
+
+
+def _base_url(context) -> str:
+    """Return the UI base URL for this worker, as resolved in before_all."""
+    return getattr(context, "base_url", BASE_URL)
 
 
 def _open_create_page(context):
-    """Navigate to the Create Inventory UI page."""
-    context.browser.get(f"{BASE_URL}/inventory/new")
+    """Navigate to the Create Inventory UI page without waiting for the load event."""
+    old_page = context.browser.find_element(By.TAG_NAME, "html")
+    context.browser.execute_cdp_cmd(
+        "Page.navigate",
+        {"url": f"{_base_url(context)}/inventory/new", "transitionType": "typed"},
+    )
+    # The previous page may be the Create page too, so wait for it to go away first
+    wait = WebDriverWait(context.browser, WAIT_SECONDS, poll_frequency=POLL_SECONDS)
+    wait.until(EC.staleness_of(old_page))
+    wait.until(EC.presence_of_element_located((By.ID, "submit")))
 
 
 def _field_id(element_name: str) -> str:
@@ -50,28 +92,10 @@ def _read_clipboard(context) -> str:
     return getattr(context, CLIPBOARD_ATTR)
 
 
-def _js_set_value(context, elem_id, value):
-    """Set an input's value using JS and dispatch an input event, then verify."""
-    context.browser.execute_script(
-        "const el = document.getElementById(arguments[0]);"
-        "if (!el) { throw new Error('Element not found: ' + arguments[0]); }"
-        "el.value = arguments[1];"
-        "el.dispatchEvent(new Event('input', {bubbles:true}));",
-        elem_id,
-        value or "",
-    )
-    WebDriverWait(context.browser, 5).until(
-        lambda d: d.find_element(By.ID, elem_id).get_attribute("value") == (value or "")
-    )
-
-
 @given("the Create Inventory page is open")
 def step_open_create_page(context):
     """Ensure the Create page is open and the submit button is present."""
     _open_create_page(context)
-    WebDriverWait(context.browser, WAIT_SECONDS).until(
-        EC.presence_of_element_located((By.ID, "submit"))
-    )
 
 
 @when("I fill the form with")
@@ -106,25 +130,23 @@ def step_fill_form(context):
         # Deterministic-enough default that won't break duplicate-SKU scenario
         name_value = f"BDD Item {uuid.uuid4().hex[:6]}"
 
-    _js_set_value(context, "name", name_value)
-    _js_set_value(context, "sku", data.get("sku", ""))
-    _js_set_value(context, "quantity", data.get("quantity", "5"))
-    _js_set_value(context, "category", data.get("category", "gadgets"))
-    _js_set_value(context, "description", data.get("description", "autofilled by test"))
-    _js_set_value(context, "price", data.get("price", "12.50"))
-    _js_set_value(context, "restock_level", data.get("restock_level", ""))
-
     # Checkbox: available (default true)
     available_str = (data.get("available", "true") or "true").strip().lower()
     available_bool = available_str in ("true", "yes", "1", "on")
-    context.browser.execute_script(
-        "const el = document.getElementById('available');"
-        "if (!!el && el.checked !== arguments[0]) { el.click(); }",
-        available_bool,
-    )
-    WebDriverWait(context.browser, 3).until(
-        lambda d: d.find_element(By.ID, "available").is_selected() == available_bool
-    )
+
+    payload = {
+        "name": name_value,
+        "sku": data.get("sku", ""),
+        "quantity": data.get("quantity", "5"),
+        "category": data.get("category", "gadgets"),
+        "description": data.get("description", "autofilled by test"),
+        "price": data.get("price", "12.50"),
+        "restock_level": data.get("restock_level", ""),
+        "available": available_bool,
+    }
+    # Set every field in a single browser round-trip
+    actual = context.browser.execute_script(FILL_FORM_JS, payload, FORM_FIELD_IDS)
+    assert actual == payload, f"Form was not filled as expected: {actual}"
 
 
 @when("I submit the form")
@@ -137,8 +159,8 @@ def step_submit_form(context):
         "arguments[0].scrollIntoView({block:'center'});", button
     )
     button.click()
-    WebDriverWait(context.browser, 30).until(
-        lambda d: d.find_element(By.ID, "result").text.strip().startswith("Status ")
+    WebDriverWait(context.browser, 30, poll_frequency=POLL_SECONDS).until(
+        lambda d: d.execute_script(RESULT_READY_JS)
     )
 
 
@@ -190,7 +212,7 @@ def step_visit_named_page(context: Any, page_name: str) -> None:
         _open_create_page(context)
         return
     if normalized in ("home", "home page"):
-        context.browser.get(BASE_URL)
+        context.browser.get(_base_url(context))
         return
     raise AssertionError(f"Don't know how to navigate to '{page_name}'")
 
@@ -236,18 +258,18 @@ def step_press_button(context: Any, button: str) -> None:
 @then('I should see the message "{message}"')
 def step_see_message(context: Any, message: str) -> None:
     """Wait until a flash message with given text appears."""
-    found = WebDriverWait(context.browser, WAIT_SECONDS).until(
-        EC.text_to_be_present_in_element((By.ID, FLASH_MESSAGE_ID), message)
-    )
+    found = WebDriverWait(
+        context.browser, WAIT_SECONDS, poll_frequency=POLL_SECONDS
+    ).until(lambda d: d.execute_script(TEXT_PRESENT_JS, FLASH_MESSAGE_ID, message))
     assert found
 
 
 @then('I should see "{name}" in the results')
 def step_see_results(context: Any, name: str) -> None:
     """Wait for the search results area to contain specific text."""
-    found = WebDriverWait(context.browser, WAIT_SECONDS).until(
-        EC.text_to_be_present_in_element((By.ID, SEARCH_RESULTS_ID), name)
-    )
+    found = WebDriverWait(
+        context.browser, WAIT_SECONDS, poll_frequency=POLL_SECONDS
+    ).until(lambda d: d.execute_script(TEXT_PRESENT_JS, SEARCH_RESULTS_ID, name))
     assert found
 
 
@@ -255,10 +277,7 @@ def step_see_results(context: Any, name: str) -> None:
 def step_copy_id_from_create(context):
     """Extract the created inventory ID from the 'result' pre block."""
     text = context.browser.find_element(By.ID, "result").text
-    # Find the first occurrence of `"id": <number>` in JSON
-    import re
-
-    match = re.search(r'"id"\s*:\s*(\d+)', text)
+    match = ID_RE.search(text)
     assert match, f"Could not find an 'id' in result:\n{text}"
     context.copied_id = match.group(1)
 
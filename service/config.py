@@ -13,7 +13,23 @@ DATABASE_URI = os.getenv(
 # Configure SQLAlchemy
 SQLALCHEMY_DATABASE_URI = DATABASE_URI
 SQLALCHEMY_TRACK_MODIFICATIONS = False
-# SQLALCHEMY_POOL_SIZE = 2
+# Keep a small pool of open connections so requests (and tests) reuse them
+# instead of paying the connect handshake each time. SQLite manages its own.
+SQLALCHEMY_ENGINE_OPTIONS = (
+    {}
+    if DATABASE_URI.startswith("sqlite")
+    else {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "2")),
+        "pool_pre_ping": False,
+    }
+)
+
+# DELETE /api/inventory wipes every row, so it is only served in testing or
+# when this is set, e.g. on the instances the BDD suite resets between scenarios
+INVENTORY_RESET_ENABLED = os.getenv("INVENTORY_RESET_ENABLED", "false").lower() in (
+    "true", "1", "yes"
+)
 
 # Secret for session management
 SECRET_KEY = os.getenv("SECRET_KEY", "sup3r-s3cr3t")
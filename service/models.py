@@ -5,8 +5,10 @@ All of the models are stored in this module
 """
 
 import logging
+from operator import itemgetter
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import inspect, text
+from sqlalchemy import inspect, lambda_stmt, text
+from sqlalchemy.orm import make_transient_to_detached, validates
 
 logger = logging.getLogger("flask.app")
 
@@ -23,6 +25,21 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
     Class that represents a Inventory
     """
 
+    # Keys that deserialize() requires, fetched together in one call
+    _REQUIRED = ("name", "sku", "quantity")
+    _REQ_GET = itemgetter(*_REQUIRED)
+    # Columns written by create() and bulk_create(); the rest come from the database
+    _BULK_COLUMNS = (
+        "name",
+        "category",
+        "description",
+        "sku",
+        "quantity",
+        "restock_level",
+        "price",
+        "available",
+    )
+
     ##################################################
     # Table Schema
     ##################################################
@@ -52,6 +69,22 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
         onupdate=db.func.now(),
     )
 
+    # secondary indexes for the find_by_* queries
+    __table_args__ = (
+        db.Index("ix_inventory_name", "name", postgresql_include=["sku", "quantity"]),
+        db.Index(
+            "ix_inventory_category", "category", postgresql_include=["sku", "quantity"]
+        ),
+        db.Index("ix_inventory_avail_cat", "available", "category"),
+        # partial index for the common "list available items" query
+        db.Index(
+            "ix_inventory_available_true",
+            "id",
+            postgresql_where=db.text("available = true"),
+            sqlite_where=db.text("available = 1"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Inventory {self.name} id=[{self.id}]>"
 
@@ -61,13 +94,27 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
         """
         logger.info("Creating %s", self.name)
         self.id = None  # pylint: disable=invalid-name
+        # unset columns are left out so their defaults apply
+        values = {
+            column: getattr(self, column)
+            for column in (*self._BULK_COLUMNS, "created_at", "last_updated")
+            if getattr(self, column) is not None
+        }
+        # the stored row, as the database rounded and defaulted it, comes
+        # back with the INSERT itself
+        stmt = db.insert(Inventory).values(**values).returning(*Inventory.__table__.c)
         try:
-            db.session.add(self)
+            row = db.session.execute(stmt).one()
             db.session.commit()
         except Exception as e:
             db.session.rollback()
             logger.error("Error creating record: %s", self)
             raise DataValidationError(e) from e
+        for column, value in row._asdict().items():
+            setattr(self, column, value)
+        # attach as already persisted so the values above are not reloaded
+        make_transient_to_detached(self)
+        db.session.add(self)
 
     def update(self) -> None:
         """
@@ -94,12 +141,27 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
             logger.error("Error deleting record: %s", self)
             raise DataValidationError(e) from e
 
+    @validates("price")
+    def _validate_price(self, _key, value):
+        """Rejects a price that cannot be read as a number"""
+        if value is not None:
+            try:
+                float(value)
+            except (TypeError, ValueError) as error:
+                raise DataValidationError(f"Invalid price: {value!r}") from error
+        return value
+
     @property
     def stock_status(self):
         """Returns stock status based on quantity and restock_level."""
-        if self.restock_level is None:
+        return self._stock_status(self.quantity, self.restock_level)
+
+    @staticmethod
+    def _stock_status(quantity, restock_level):
+        """Returns the stock status for a quantity and restock_level pair"""
+        if restock_level is None:
             return "not configured"
-        if self.quantity <= self.restock_level:
+        if quantity <= restock_level:
             return "stock insufficient"
         return "stock sufficient"
 
@@ -114,10 +176,14 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
             "quantity": self.quantity,
             "restock_level": self.restock_level,
             "stock_status": self.stock_status,
-            "price": float(self.price) if self.price else None,
+            "price": float(self.price) if self.price is not None else None,
             "available": self.available,
-            "created_at": self.created_at,
-            "last_updated": self.last_updated,
+            "created_at": (
+                self.created_at.isoformat() if self.created_at is not None else None
+            ),
+            "last_updated": (
+                self.last_updated.isoformat() if self.last_updated is not None else None
+            ),
         }
 
     def deserialize(self, data):
@@ -128,11 +194,9 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
             data (dict): A dictionary containing the resource data
         """
         try:
-            self.name = data["name"]
+            self.name, self.sku, self.quantity = self._REQ_GET(data)
             self.category = data.get("category")
             self.description = data.get("description")
-            self.sku = data["sku"]
-            self.quantity = data["quantity"]
             self.restock_level = data.get("restock_level")
             self.price = data.get("price")
             self.available = data.get("available", True)
@@ -157,7 +221,139 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
     def all(cls) -> list:
         """Returns all of the Inventory in the database"""
         logger.info("Processing all Inventory")
-        return cls.query.all()
+        return db.session.scalars(lambda_stmt(lambda: db.select(cls))).all()
+
+    @classmethod
+    def list_as_dicts(cls, **filters) -> list:
+        """Returns the Inventory matching the filters as dictionaries
+
+        Rows are read with a Core select, so no Inventory objects are built.
+        The dictionaries have the same keys as serialize(), but the timestamps
+        are left as datetime objects.
+
+        :param filters: column values to match, e.g. category="Shoes"
+        :type filters: dict
+
+        :return: a dictionary for each matching Inventory
+        :rtype: list
+
+        """
+        logger.info("Processing Inventory rows for %s ...", filters)
+        stmt = db.select(cls.__table__).filter_by(**filters)
+        return [
+            {
+                **row,
+                "price": float(row["price"]) if row["price"] is not None else None,
+                "stock_status": cls._stock_status(
+                    row["quantity"], row["restock_level"]
+                ),
+            }
+            for row in db.session.execute(stmt).mappings()
+        ]
+
+    @classmethod
+    def ids_only(cls) -> list:
+        """Returns the ids of all Inventory without loading full objects"""
+        logger.info("Processing all Inventory ids")
+        return list(db.session.scalars(db.select(cls.id)))
+
+    @classmethod
+    def bulk_create(cls, rows: list) -> int:
+        """Creates many Inventory with a single INSERT and commit
+
+        :param rows: the dictionaries to create, in deserialize() format
+        :type rows: list
+
+        :return: the number of Inventory that were created
+        :rtype: int
+
+        """
+        logger.info("Creating %d Inventory in bulk", len(rows))
+        records = [cls().deserialize(row) for row in rows]
+        if not records:
+            return 0
+        values = [
+            {column: getattr(record, column) for column in cls._BULK_COLUMNS}
+            for record in records
+        ]
+        try:
+            db.session.execute(db.insert(cls), values)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error creating %d records in bulk", len(values))
+            raise DataValidationError(e) from e
+        return len(values)
+
+    @classmethod
+    def remove_all(cls) -> int:
+        """Removes every Inventory from the data store in a single statement
+
+        :return: the number of Inventory rows that were removed
+        :rtype: int
+
+        """
+        logger.info("Removing all Inventory")
+        try:
+            count = db.session.query(cls).delete()
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error removing all records")
+            raise DataValidationError(e) from e
+        return count
+
+    @classmethod
+    def delete_by_id(cls, inventory_id: int) -> int:
+        """Removes an Inventory by its ID with a single DELETE statement
+
+        :param inventory_id: the id of the Inventory to remove
+        :type inventory_id: int
+
+        :return: the number of Inventory rows that were removed
+        :rtype: int
+
+        """
+        logger.info("Deleting id %s ...", inventory_id)
+        try:
+            result = db.session.execute(db.delete(cls).where(cls.id == inventory_id))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error deleting record with id %s", inventory_id)
+            raise DataValidationError(e) from e
+        return result.rowcount
+
+    @classmethod
+    def purchase(cls, inventory_id: int):
+        """Marks an available Inventory as unavailable in a single UPDATE
+
+        :param inventory_id: the id of the Inventory to purchase
+        :type inventory_id: int
+
+        :return: the purchased Inventory, detached from the session, or None
+            if it is missing or unavailable
+        :rtype: Inventory
+
+        """
+        logger.info("Purchasing id %s ...", inventory_id)
+        stmt = (
+            db.update(cls)
+            .where(cls.id == inventory_id, cls.available.is_(True))
+            .values(available=False)
+            .returning(cls)
+        )
+        try:
+            inv = db.session.execute(stmt).scalar_one_or_none()
+            # keep the values from RETURNING instead of expiring them on commit
+            if inv is not None:
+                db.session.expunge(inv)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            logger.error("Error purchasing record with id %s", inventory_id)
+            raise DataValidationError(e) from e
+        return inv
 
     @classmethod
     def find(cls, inventory_id: int):
@@ -171,7 +367,35 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
 
         """
         logger.info("Processing lookup for id %s ...", inventory_id)
-        return cls.query.session.get(cls, inventory_id)
+        return db.session.get(cls, inventory_id)
+
+    @classmethod
+    def sku_exists(cls, sku: str) -> bool:
+        """Checks whether an Inventory with the given SKU exists
+
+        :param sku: the SKU to look for
+        :type sku: str
+
+        :return: True if the SKU is already in use
+        :rtype: bool
+
+        """
+        logger.info("Processing SKU existence check for %s ...", sku)
+        return db.session.scalar(db.select(db.exists().where(cls.sku == sku)))
+
+    @classmethod
+    def existing_skus(cls, skus: list) -> set:
+        """Returns which of the given SKUs are already in use
+
+        :param skus: the SKUs to look for
+        :type skus: list
+
+        :return: the SKUs that already belong to an Inventory
+        :rtype: set
+
+        """
+        logger.info("Processing SKU existence check for %d SKUs ...", len(skus))
+        return set(db.session.scalars(db.select(cls.sku).where(cls.sku.in_(skus))))
 
     @classmethod
     def find_by_name(cls, name: str) -> list:
@@ -185,7 +409,8 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
+        stmt = lambda_stmt(lambda: db.select(cls).where(cls.name == name))
+        return db.session.scalars(stmt).all()
 
     @classmethod
     def find_by_category(cls, category: str) -> list:
@@ -199,23 +424,23 @@ class Inventory(db.Model):  # pylint: disable=too-many-instance-attributes
 
         """
         logger.info("Processing category query for %s ...", category)
-        return cls.query.filter(cls.category == category)
+        stmt = lambda_stmt(lambda: db.select(cls).where(cls.category == category))
+        return db.session.scalars(stmt).all()
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
         """Returns all Inventory by their availability
 
         :param available: True for inventorys that are available
-        :type available: str
+        :type available: bool
 
         :return: a collection of Inventory that are available
         :rtype: list
 
         """
-        if not isinstance(available, bool):
-            raise TypeError("Invalid availability, must be of type boolean")
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        stmt = lambda_stmt(lambda: db.select(cls).where(cls.available == available))
+        return db.session.scalars(stmt).all()
 
 
 def ensure_inventory_schema(engine=None):
@@ -9,8 +9,12 @@ Inventory Service using Flask-RESTX + Swagger
 Refactored from plain Flask routes to RESTX Resource classes.
 """
 
-from flask import current_app as app, render_template, request
-from flask_restx import Api, Resource, fields, reqparse, inputs
+import hashlib
+from collections import Counter
+
+from flask import current_app as app, make_response, render_template, request
+from flask_restx import Api, Resource, fields, reqparse
+from werkzeug.http import quote_etag
 
 
 from service.models import Inventory
@@ -30,6 +34,15 @@ api = Api(
 )
 
 
+@api.representation("application/json")
+def output_json(data, code, headers=None):
+    """Render RESTX responses with the application's orjson provider"""
+    response = make_response(app.json.dumpb(data), code)
+    response.headers.extend(headers or {})
+    response.mimetype = "application/json"
+    return response
+
+
 ######################################################################
 # Index (UI)
 ######################################################################
@@ -85,6 +98,37 @@ inventory_model = api.inherit(
     },
 )
 
+inventory_bulk_model = api.model(
+    "InventoryBulk",
+    {
+        "items": fields.List(
+            fields.Nested(inventory_create_model),
+            required=True,
+            description="Inventory items to create",
+        ),
+    },
+)
+
+######################################################################
+# Helper: Query String Booleans
+######################################################################
+
+TRUE_VALUES = frozenset({"true", "1", "yes", "t", "y"})
+FALSE_VALUES = frozenset({"false", "0", "no", "f", "n"})
+
+
+def parse_boolean(value):
+    """Parse a query string boolean, raising ValueError when it is not one"""
+    value = value.lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
+
+
+parse_boolean.__schema__ = {"type": "boolean"}
+
 ######################################################################
 # Argument Parser (Query Filters)
 ######################################################################
@@ -92,7 +136,7 @@ inventory_model = api.inherit(
 inventory_args = reqparse.RequestParser()
 inventory_args.add_argument("name", type=str, location="args")
 inventory_args.add_argument("category", type=str, location="args")
-inventory_args.add_argument("available", type=inputs.boolean, location="args")
+inventory_args.add_argument("available", type=parse_boolean, location="args")
 
 ######################################################################
 # Helper: JSON Error Handler
@@ -115,7 +159,8 @@ def abort(code, message):
 class InventoryResource(Resource):
     """Handles a single Inventory item"""
 
-    @api.marshal_with(inventory_model)
+    @api.response(200, "Success", inventory_model)
+    @api.response(304, "Inventory not modified")
     @api.response(404, "Inventory not found")
     def get(self, inventory_id):
         """Retrieve a single Inventory"""
@@ -125,7 +170,7 @@ class InventoryResource(Resource):
                 status.HTTP_404_NOT_FOUND,
                 f"Inventory with id {inventory_id} was not found",
             )
-        return inv.serialize(), status.HTTP_200_OK
+        return conditional_json(inv.serialize())
 
     @api.expect(inventory_create_model)
     @api.marshal_with(inventory_model)
@@ -148,9 +193,7 @@ class InventoryResource(Resource):
     @api.response(204, "Inventory deleted")
     def delete(self, inventory_id):
         """Delete an Inventory"""
-        inv = Inventory.find(inventory_id)
-        if inv:
-            inv.delete()
+        Inventory.delete_by_id(inventory_id)
         return "", status.HTTP_204_NO_CONTENT
 
 
@@ -163,22 +206,29 @@ class InventoryResource(Resource):
 class InventoryCollection(Resource):
     """Handles the Inventory collection"""
 
-    @api.expect(inventory_args, validate=True)
-    @api.marshal_list_with(inventory_model)
+    # inventory_args only documents the filters; they are read from request.args
+    @api.expect(inventory_args)
+    @api.response(200, "Success", [inventory_model])
+    @api.response(400, "Invalid query parameter")
     def get(self):
         """List all Inventory or filter"""
-        args = inventory_args.parse_args()
-
-        if args.get("category"):
-            items = Inventory.find_by_category(args["category"])
-        elif args.get("name"):
-            items = Inventory.find_by_name(args["name"])
-        elif args.get("available") is not None:
-            items = Inventory.find_by_availability(args["available"])
+        category = request.args.get("category")
+        name = request.args.get("name")
+        available = request.args.get("available")
+
+        if category:
+            filters = {"category": category}
+        elif name:
+            filters = {"name": name}
+        elif available is not None:
+            try:
+                filters = {"available": parse_boolean(available)}
+            except ValueError as error:
+                abort(status.HTTP_400_BAD_REQUEST, str(error))
         else:
-            items = Inventory.all()
+            filters = {}
 
-        return [i.serialize() for i in items], status.HTTP_200_OK
+        return Inventory.list_as_dicts(**filters), status.HTTP_200_OK
 
     @api.expect(inventory_create_model)
     @api.marshal_with(inventory_model, code=201)
@@ -186,29 +236,13 @@ class InventoryCollection(Resource):
     @api.response(400, "Invalid data")
     def post(self):
         """Create a new Inventory item"""
-        if request.content_type != "application/json":
-            abort(
-                status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                "Content-Type must be application/json",
-            )
+        check_content_type("application/json")
         data = api.payload
 
-        if Inventory.query.filter(Inventory.sku == data.get("sku")).first():
+        if Inventory.sku_exists(data.get("sku")):
             abort(status.HTTP_409_CONFLICT, f"SKU '{data.get('sku')}' already exists")
 
-        # Validate quantity (must be int and >= 0)
-        if data.get("quantity") is not None:
-            if not isinstance(data["quantity"], int):
-                abort(status.HTTP_400_BAD_REQUEST, "quantity must be an integer")
-            if data["quantity"] < 0:
-                abort(status.HTTP_400_BAD_REQUEST, "quantity must be non-negative")
-
-        # Validate price (must be int/float and >= 0)
-        if data.get("price") is not None:
-            if not isinstance(data["price"], (int, float)):
-                abort(status.HTTP_400_BAD_REQUEST, "price must be numeric")
-            if data["price"] < 0:
-                abort(status.HTTP_400_BAD_REQUEST, "price must be non-negative")
+        check_quantity_and_price(data)
 
         inv = Inventory()
         inv.deserialize(data)
@@ -219,6 +253,58 @@ class InventoryCollection(Resource):
         )
         return inv.serialize(), status.HTTP_201_CREATED, {"Location": location_url}
 
+    @api.response(204, "All Inventory deleted")
+    @api.response(403, "Deleting all Inventory is disabled")
+    def delete(self):
+        """Delete all Inventory items
+
+        Only served in testing or when INVENTORY_RESET_ENABLED is set.
+        """
+        if not (app.config["TESTING"] or app.config["INVENTORY_RESET_ENABLED"]):
+            abort(status.HTTP_403_FORBIDDEN, "Deleting all Inventory is disabled")
+        Inventory.remove_all()
+        return "", status.HTTP_204_NO_CONTENT
+
+
+######################################################################
+# /api/inventory/bulk
+######################################################################
+
+
+@api.route("/inventory/bulk")
+class InventoryBulk(Resource):
+    """Creates many Inventory items at once"""
+
+    @api.expect(inventory_bulk_model)
+    @api.response(201, "Inventory created")
+    @api.response(400, "Invalid data")
+    @api.response(409, "SKU already exists")
+    def post(self):
+        """Create a batch of Inventory items in one transaction"""
+        check_content_type("application/json")
+        data = api.payload
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            abort(status.HTTP_400_BAD_REQUEST, "items must be a list")
+
+        # every item passes the single-create checks before anything is stored
+        for item in items:
+            if not isinstance(item, dict):
+                abort(status.HTTP_400_BAD_REQUEST, "items must be objects")
+            check_quantity_and_price(item)
+        skus = [item.get("sku") for item in items]
+        taken = Inventory.existing_skus(skus)
+        taken.update(sku for sku, count in Counter(skus).items() if count > 1)
+        taken.discard(None)
+        if taken:
+            abort(
+                status.HTTP_409_CONFLICT,
+                f"SKUs already exist: {', '.join(sorted(taken))}",
+            )
+
+        count = Inventory.bulk_create(items)
+        return {"count": count}, status.HTTP_201_CREATED
+
 
 ######################################################################
 # /api/inventory/<id>/purchase
@@ -229,26 +315,24 @@ class InventoryCollection(Resource):
 class InventoryPurchase(Resource):
     """Purchase inventory"""
 
-    @api.marshal_with(inventory_model)
+    @api.response(200, "Success", inventory_model)
     @api.response(404, "Inventory not found")
     @api.response(409, "Inventory not available")
     def put(self, inventory_id):
         """Mark an inventory item unavailable when it is purchased"""
-        inv = Inventory.find(inventory_id)
+        inv = Inventory.purchase(inventory_id)
         if not inv:
-            abort(
-                status.HTTP_404_NOT_FOUND,
-                f"Inventory with id {inventory_id} not found.",
-            )
-
-        if not inv.available:
+            # nothing was updated, so find out why
+            if not Inventory.find(inventory_id):
+                abort(
+                    status.HTTP_404_NOT_FOUND,
+                    f"Inventory with id {inventory_id} not found.",
+                )
             abort(
                 status.HTTP_409_CONFLICT,
                 f"Inventory with id {inventory_id} is not available.",
             )
 
-        inv.available = False
-        inv.update()
         return inv.serialize(), status.HTTP_200_OK
 
 
@@ -261,6 +345,7 @@ class InventoryPurchase(Resource):
 class InventoryRestockStatus(Resource):
     """Restock status endpoint"""
 
+    @api.response(304, "Inventory not modified")
     @api.response(404, "Inventory not found")
     def get(self, inventory_id):
         """Report whether more stock is needed for the item"""
@@ -271,17 +356,56 @@ class InventoryRestockStatus(Resource):
                 f"Inventory with id {inventory_id} was not found",
             )
 
-        return {
-            "id": inv.id,
-            "quantity": inv.quantity,
-            "restock_level": inv.restock_level,
-            "stock_status": inv.stock_status,
-        }, status.HTTP_200_OK
+        return conditional_json(
+            {
+                "id": inv.id,
+                "quantity": inv.quantity,
+                "restock_level": inv.restock_level,
+                "stock_status": inv.stock_status,
+            }
+        )
+
+
+######################################################################
+# Helper: Conditional GET
+######################################################################
+def conditional_json(data):
+    """Returns data as a JSON response, or an empty 304 if the client has it
+
+    The weak ETag is a digest of the JSON body, so any change to the data
+    changes it, even within the resolution of last_updated. The body is
+    encoded once and used for both the digest and the response.
+    """
+    body = app.json.dumpb(data)
+    etag = hashlib.sha1(body, usedforsecurity=False).hexdigest()
+    headers = {"ETag": quote_etag(etag, weak=True)}
+    if request.if_none_match.contains_weak(etag):
+        return "", status.HTTP_304_NOT_MODIFIED, headers
+    response = make_response(body, status.HTTP_200_OK, headers)
+    response.mimetype = "application/json"
+    return response
 
 
 ######################################################################
 # Helper: Content Type Check
 ######################################################################
+def check_quantity_and_price(data):
+    """Aborts with 400 unless quantity and price are non-negative numbers"""
+    # quantity must be an int >= 0
+    if data.get("quantity") is not None:
+        if not isinstance(data["quantity"], int):
+            abort(status.HTTP_400_BAD_REQUEST, "quantity must be an integer")
+        if data["quantity"] < 0:
+            abort(status.HTTP_400_BAD_REQUEST, "quantity must be non-negative")
+
+    # price must be an int/float >= 0
+    if data.get("price") is not None:
+        if not isinstance(data["price"], (int, float)):
+            abort(status.HTTP_400_BAD_REQUEST, "price must be numeric")
+        if data["price"] < 0:
+            abort(status.HTTP_400_BAD_REQUEST, "price must be non-negative")
+
+
 def check_content_type(media_type):
     """Checks that the media type is correct"""
     content_type = request.headers.get("Content-Type")
@@ -290,5 +414,5 @@ def check_content_type(media_type):
     app.logger.error("Invalid Content-Type: %s", content_type)
     abort(
         status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-        f"Unsupported media type: {content_type}. Must be {media_type}",
+        f"Unsupported media type: {content_type}. Content-Type must be {media_type}",
     )
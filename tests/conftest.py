@@ -0,0 +1,202 @@
+"""
+Shared pytest fixtures for the Inventory test suite
+"""
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event, make_url, text
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+
+def _per_worker_database_uri(uri: str, worker: str) -> str:
+    """Return a URI for a database that only this xdist worker uses
+
+    The database is named after the configured one plus the worker id. On
+    Postgres it is created here and SQLite creates its file itself; both are
+    dropped again by _drop_per_worker_database() when the session ends.
+    In-memory SQLite is returned unchanged, since each worker process already
+    has its own.
+    """
+    url = make_url(uri)
+    name = f"{url.database}_{worker}"
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return uri
+        return url.set(database=name).render_as_string(hide_password=False)
+    if url.get_backend_name() != "postgresql":
+        return uri
+    engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        exists = connection.scalar(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": name}
+        )
+        if not exists:
+            connection.execute(text(f'CREATE DATABASE "{name}"'))
+    engine.dispose()
+    return url.set(database=name).render_as_string(hide_password=False)
+
+
+def _drop_per_worker_database(uri: str, worker_uri: str) -> None:
+    """Drop the database that _per_worker_database_uri() gave this worker
+
+    Postgres cannot drop the database a connection is using, so the DROP is
+    issued through the configured database instead.
+    """
+    if worker_uri == uri:
+        return
+    url = make_url(worker_uri)
+    if url.get_backend_name() == "sqlite":
+        Path(url.database).unlink(missing_ok=True)
+        return
+    engine = create_engine(make_url(uri), isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        connection.execute(text(f'DROP DATABASE IF EXISTS "{url.database}"'))
+    engine.dispose()
+
+
+# The app reads DATABASE_URI when it is created, so the default is set first.
+# Unit tests run against in-memory SQLite unless DATABASE_URI points elsewhere,
+# e.g. at the Postgres testdb that CI provides. Under pytest-xdist every
+# worker gets a database of its own.
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")
+CONFIGURED_DATABASE_URI = os.environ["DATABASE_URI"]
+if "PYTEST_XDIST_WORKER" in os.environ:
+    os.environ["DATABASE_URI"] = _per_worker_database_uri(
+        os.environ["DATABASE_URI"], os.environ["PYTEST_XDIST_WORKER"]
+    )
+
+# pylint: disable=wrong-import-position
+from service.models import db  # noqa: E402
+from wsgi import app  # noqa: E402
+
+from .factories import InventoryFactory  # noqa: E402
+
+# Quiet logging once at import. The app logger is set after create_app()
+# because init_logging() gives it gunicorn's level.
+logging.getLogger().setLevel(logging.CRITICAL)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.CRITICAL)
+app.logger.setLevel(logging.CRITICAL)
+
+
+def pytest_runtest_setup(item):
+    """Skip tests marked postgres unless DATABASE_URI points at PostgreSQL"""
+    if item.get_closest_marker("postgres"):
+        if make_url(os.environ["DATABASE_URI"]).get_backend_name() != "postgresql":
+            pytest.skip("needs a PostgreSQL DATABASE_URI")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def testing_app():
+    """Put the application into testing mode once for the whole session"""
+    app.config["TESTING"] = True
+    app.config["DEBUG"] = False
+    return app
+
+
+def _use_sqlite_savepoints(engine):
+    """Let pysqlite run SAVEPOINTs inside an explicit transaction"""
+
+    @event.listens_for(engine, "connect")
+    def _no_implicit_begin(dbapi_connection, _record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _explicit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    # pooled connections were opened before the listeners existed
+    engine.dispose()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _app_ctx(testing_app):  # pylint: disable=redefined-outer-name
+    """Push one app context that every test in the session shares"""
+    ctx = testing_app.app_context()
+    ctx.push()
+    yield
+    ctx.pop()
+
+
+@pytest.fixture(scope="session")
+def _db(_app_ctx):  # pylint: disable=redefined-outer-name
+    """Build the schema once for the whole session"""
+    if db.engine.dialect.name == "sqlite":
+        _use_sqlite_savepoints(db.engine)
+    db.drop_all()
+    db.create_all()
+    yield db
+    db.session.close()
+    db.engine.dispose()
+    _drop_per_worker_database(CONFIGURED_DATABASE_URI, os.environ["DATABASE_URI"])
+
+
+@pytest.fixture(scope="session")
+def _connection(_db):  # pylint: disable=redefined-outer-name
+    """Bind db.session to one connection whose transaction is never committed
+
+    The session joins the connection with create_savepoint, so commits made
+    by the code under test only release a SAVEPOINT. It neither autoflushes
+    nor expires instances on commit, so tests must flush explicitly before
+    querying pending changes, and reading attributes after a commit costs
+    no SELECT.
+    """
+    connection = _db.engine.connect()
+    transaction = connection.begin()
+    session = _db.session
+    _db.session = scoped_session(
+        sessionmaker(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    )
+    yield connection
+    _db.session.remove()
+    transaction.rollback()
+    connection.close()
+    _db.session = session
+
+
+@pytest.fixture(autouse=True)
+def _tx(request, _connection):  # pylint: disable=redefined-outer-name
+    """Roll back everything a test writes once it finishes
+
+    Tests marked readonly never touch the database and skip the savepoint.
+    """
+    if request.node.get_closest_marker("readonly"):
+        yield
+        return
+    savepoint = _connection.begin_nested()
+    yield
+    db.session.remove()
+    savepoint.rollback()
+
+
+def _persisted_batch(connection, size):
+    """Yield a batch of saved Inventory, rolling it back afterwards"""
+    savepoint = connection.begin_nested()
+    yield InventoryFactory.create_batch_and_persist(size)
+    db.session.remove()
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="module")
+def inventory_corpus(_connection):  # pylint: disable=redefined-outer-name
+    """Ten Inventory rows shared by the read-only tests of one module"""
+    yield from _persisted_batch(_connection, 10)
+
+
+@pytest.fixture(scope="class")
+def seeded_inventory(_connection):  # pylint: disable=redefined-outer-name
+    """Ten Inventory rows shared by the read-only tests of one class"""
+    yield from _persisted_batch(_connection, 10)
+
+
+@pytest.fixture(scope="session")
+def client(testing_app):  # pylint: disable=redefined-outer-name
+    """One Flask test client shared by every test in the session"""
+    return testing_app.test_client()
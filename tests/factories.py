@@ -4,8 +4,22 @@ from datetime import datetime
 import random
 
 import factory
+from faker import Faker
 
-from service.models import Inventory
+from service.models import Inventory, db
+
+# Fake values are generated once per process and then indexed by sequence.
+# Both generators are seeded so every run builds the same data.
+_RNG = random.Random(0)
+_FAKER = Faker()
+_FAKER.seed_instance(0)
+_WORDS = _FAKER.words(nb=10_000)
+_SENTENCES = [_FAKER.sentence() for _ in range(2_000)]
+_CATEGORIES = _RNG.choices(
+    ["Shoes", "Clothing", "Accessories", "Sports", "Electronics"], k=1024
+)
+# tests only compare timestamps with each other, so one value is enough
+_NOW = datetime.utcnow()
 
 
 class InventoryFactory(factory.Factory):  # pylint: disable=too-few-public-methods
@@ -16,17 +30,20 @@ class InventoryFactory(factory.Factory):  # pylint: disable=too-few-public-metho
 
         model = Inventory
 
-    id = factory.Sequence(lambda n: n + 1)
-    name = factory.Faker("word")
-    category = factory.LazyFunction(
-        lambda: random.choice(
-            ["Shoes", "Clothing", "Accessories", "Sports", "Electronics"]
-        )
-    )
-    description = factory.Faker("sentence")
+    name = factory.Sequence(lambda n: _WORDS[n % len(_WORDS)])
+    category = factory.Sequence(lambda n: _CATEGORIES[n % len(_CATEGORIES)])
+    description = factory.Sequence(lambda n: _SENTENCES[n % len(_SENTENCES)])
     sku = factory.Sequence(lambda n: f"SKU-{n+1000}")
-    quantity = factory.LazyFunction(lambda: random.randint(1, 100))
-    price = factory.LazyFunction(lambda: round(random.uniform(10, 500), 2))
-    available = factory.LazyFunction(lambda: random.choice([True, False]))
-    created_at = factory.LazyFunction(datetime.utcnow)
-    last_updated = factory.LazyFunction(datetime.utcnow)
+    quantity = factory.LazyFunction(lambda: _RNG.randint(1, 100))
+    price = factory.LazyFunction(lambda: round(_RNG.uniform(10, 500), 2))
+    available = factory.LazyFunction(lambda: _RNG.choice([True, False]))
+    created_at = _NOW
+    last_updated = _NOW
+
+    @classmethod
+    def create_batch_and_persist(cls, size, **kwargs):
+        """Builds a batch of Inventory and saves it with one INSERT and commit"""
+        batch = cls.build_batch(size, **kwargs)
+        db.session.bulk_save_objects(batch, return_defaults=True)
+        db.session.commit()
+        return batch
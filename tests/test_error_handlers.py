@@ -3,25 +3,23 @@ Test Cases for Error Handlers
 """
 
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch
 from service.common import status
 from service.models import DataValidationError
 from service.common import error_handlers
-from wsgi import app  # import actual Flask app to provide context
 
 
-class TestErrorHandlers(unittest.TestCase):
-    """Test Cases for Error Handlers"""
+def fake_jsonify(**kwargs):
+    """Stands in for jsonify so the handlers skip building a Response"""
+    return SimpleNamespace(json=kwargs)
+
 
-    def setUp(self):
-        """Set up test client and push app context"""
-        self.app = app.test_client()
-        self.app_context = app.app_context()
-        self.app_context.push()  # ✅ enter Flask app context
+class TestErrorHandlers(unittest.TestCase):
+    """Test Cases for Error Handlers
 
-    def tearDown(self):
-        """Pop app context after tests"""
-        self.app_context.pop()
+    The app context these handlers need is pushed once by conftest.py
+    """
 
     ######################################################################
     # TEST: request_validation_error
@@ -36,6 +34,7 @@ class TestErrorHandlers(unittest.TestCase):
     ######################################################################
     # TEST: bad_request
     ######################################################################
+    @patch("service.common.error_handlers.jsonify", new=fake_jsonify)
     @patch("service.common.error_handlers.app.logger.warning")
     def test_bad_request(self, mock_logger):
         """It should return JSON response with 400 status"""
@@ -51,6 +50,7 @@ class TestErrorHandlers(unittest.TestCase):
     ######################################################################
     # TEST: method_not_supported
     ######################################################################
+    @patch("service.common.error_handlers.jsonify", new=fake_jsonify)
     @patch("service.common.error_handlers.app.logger.warning")
     def test_method_not_supported(self, mock_logger):
         """It should return JSON response with 405 status"""
@@ -66,6 +66,7 @@ class TestErrorHandlers(unittest.TestCase):
     ######################################################################
     # TEST: mediatype_not_supported
     ######################################################################
+    @patch("service.common.error_handlers.jsonify", new=fake_jsonify)
     @patch("service.common.error_handlers.app.logger.warning")
     def test_mediatype_not_supported(self, mock_logger):
         """It should return JSON response with 415 status"""
@@ -83,6 +84,7 @@ class TestErrorHandlers(unittest.TestCase):
     ######################################################################
     # TEST: internal_server_error
     ######################################################################
+    @patch("service.common.error_handlers.jsonify", new=fake_jsonify)
     @patch("service.common.error_handlers.app.logger.error")
     def test_internal_server_error(self, mock_logger):
         """It should return JSON response with 500 status"""
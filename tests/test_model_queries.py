@@ -0,0 +1,80 @@
+######################################################################
+# Copyright 2016, 2024 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+
+"""
+Test cases for Inventory Model queries
+"""
+
+import logging
+
+from service.models import Inventory
+
+
+######################################################################
+#  Q U E R Y   T E S T   C A S E S
+######################################################################
+# These tests only read, so they share one corpus of Inventory rows
+
+
+def test_find_inventory(inventory_corpus):
+    """It should Find a Inventory by ID"""
+    logging.debug(inventory_corpus)
+    # make sure they got saved
+    assert len(Inventory.all()) == len(inventory_corpus)
+    # find the 2nd inventory in the list
+    inventory = Inventory.find(inventory_corpus[1].id)
+    assert inventory is not None
+    assert inventory.id == inventory_corpus[1].id
+    assert inventory.name == inventory_corpus[1].name
+    assert inventory.available == inventory_corpus[1].available
+
+
+def test_find_by_category(inventory_corpus):
+    """It should Find Inventory by Category"""
+    category = inventory_corpus[0].category
+    count = len(
+        [inventory for inventory in inventory_corpus if inventory.category == category]
+    )
+    found = Inventory.find_by_category(category)
+    assert len(found) == count
+    for inventory in found:
+        assert inventory.category == category
+
+
+def test_find_by_name(inventory_corpus):
+    """It should Find a Inventory by Name"""
+    name = inventory_corpus[0].name
+    count = len([inventory for inventory in inventory_corpus if inventory.name == name])
+    found = Inventory.find_by_name(name)
+    assert len(found) == count
+    for inventory in found:
+        assert inventory.name == name
+
+
+def test_find_by_availability(inventory_corpus):
+    """It should Find Inventory by Availability"""
+    available = inventory_corpus[0].available
+    count = len(
+        [
+            inventory
+            for inventory in inventory_corpus
+            if inventory.available == available
+        ]
+    )
+    found = Inventory.find_by_availability(available)
+    assert len(found) == count
+    for inventory in found:
+        assert inventory.available == available